@@ -0,0 +1,103 @@
+"""
+Validation utilities for attendance data.
+
+validate_attendance_batch() validates a list of records in one pass, parsing
+each distinct date only once; validate_attendance_data() is the one-record
+wrapper used by the single-record endpoints.
+"""
+
+import re
+from datetime import datetime
+
+from apps.employees.validators import clean_text
+
+DATE_REGEX = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+VALID_STATUSES = ('Present', 'Absent')
+VALID_STATUS_SET = frozenset(VALID_STATUSES)
+
+
+def check_date(date_str):
+    """Return an error message for a YYYY-MM-DD date string, or None if valid."""
+    if not date_str:
+        return 'Date is required.'
+    if not DATE_REGEX.match(date_str):
+        return 'Date must be in YYYY-MM-DD format.'
+    try:
+        datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        return 'Invalid date value.'
+    return None
+
+
+def _validate_attendance_row(data, date_errors):
+    errors = {}
+    cleaned = {}
+
+    employee_id = clean_text(data.get('employee_id'))
+    if employee_id is None:
+        errors['employee_id'] = 'Employee ID must be a string.'
+    elif not employee_id:
+        errors['employee_id'] = 'Employee ID is required.'
+    else:
+        cleaned['employee_id'] = employee_id.upper()
+
+    date_str = clean_text(data.get('date'))
+    if date_str is None:
+        date_errors[None] = 'Date must be a string.'
+    elif date_str not in date_errors:
+        date_errors[date_str] = check_date(date_str)
+    date_error = date_errors[date_str]
+    if date_error:
+        errors['date'] = date_error
+    else:
+        cleaned['date'] = date_str
+
+    att_status = clean_text(data.get('status'))
+    if att_status is None:
+        errors['status'] = 'Status must be a string.'
+    elif not att_status:
+        errors['status'] = 'Status is required.'
+    elif att_status not in VALID_STATUS_SET:
+        errors['status'] = f"Status must be one of: {', '.join(VALID_STATUSES)}."
+    else:
+        cleaned['status'] = att_status
+
+    return cleaned, errors
+
+
+def validate_attendance_batch(records):
+    """
+    Validate a list of attendance records in one pass.
+    Returns (cleaned_rows, row_errors) tuple.
+    cleaned_rows is aligned with records and holds the cleaned dict, or None
+    for rows that failed. row_errors is a list of {'index': i, 'fields': {...}}.
+    """
+    # Date string -> error message (None when valid); bulk payloads usually
+    # repeat a handful of dates, so each is parsed once per batch.
+    date_errors = {}
+    cleaned_rows = []
+    row_errors = []
+    for index, data in enumerate(records):
+        if not isinstance(data, dict):
+            cleaned_rows.append(None)
+            row_errors.append({'index': index, 'fields': {'record': 'Record must be an object.'}})
+            continue
+        cleaned, errors = _validate_attendance_row(data, date_errors)
+        if errors:
+            cleaned_rows.append(None)
+            row_errors.append({'index': index, 'fields': errors})
+        else:
+            cleaned_rows.append(cleaned)
+    return cleaned_rows, row_errors
+
+
+def validate_attendance_data(data):
+    """
+    Validate attendance marking data.
+    Returns (cleaned_data, errors) tuple.
+    errors is a dict of field -> error message, or empty dict if valid.
+    """
+    cleaned_rows, row_errors = validate_attendance_batch([data])
+    if row_errors:
+        return {}, row_errors[0]['fields']
+    return cleaned_rows[0], {}
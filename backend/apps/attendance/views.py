@@ -3,52 +3,15 @@ Attendance API Views for HRMS Lite.
 Handles marking and viewing attendance records.
 """
 
-from datetime import datetime, timezone, date
-import re
-
-import pymongo.errors
+from datetime import datetime, timezone
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
-from hrms_project.db import get_db
-
-DATE_REGEX = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-VALID_STATUSES = ('Present', 'Absent')
-
-
-def validate_attendance_data(data):
-    errors = {}
-    cleaned = {}
-
-    employee_id = data.get('employee_id', '').strip()
-    if not employee_id:
-        errors['employee_id'] = 'Employee ID is required.'
-    else:
-        cleaned['employee_id'] = employee_id.upper()
-
-    date_str = data.get('date', '').strip()
-    if not date_str:
-        errors['date'] = 'Date is required.'
-    elif not DATE_REGEX.match(date_str):
-        errors['date'] = 'Date must be in YYYY-MM-DD format.'
-    else:
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            cleaned['date'] = date_str
-        except ValueError:
-            errors['date'] = 'Invalid date value.'
-
-    att_status = data.get('status', '').strip()
-    if not att_status:
-        errors['status'] = 'Status is required.'
-    elif att_status not in VALID_STATUSES:
-        errors['status'] = f"Status must be one of: {', '.join(VALID_STATUSES)}."
-    else:
-        cleaned['status'] = att_status
-
-    return cleaned, errors
+from hrms_project.db import PRIMARY, get_db
+from hrms_project.events import publish_change
+from .validators import check_date, validate_attendance_batch, validate_attendance_data
 
 
 def serialize_attendance(doc):
@@ -69,7 +32,6 @@ class AttendanceListView(APIView):
     """
 
     def get(self, request):
-        db = get_db()
         query = {}
 
         employee_id = request.query_params.get('employee_id', '').strip()
@@ -84,6 +46,8 @@ class AttendanceListView(APIView):
         if month:
             query['date'] = {'$regex': f'^{month}'}
 
+        # Month listings are history; other listings are read right after marking.
+        db = get_db('reporting' if month else PRIMARY)
         records = list(db.attendance.find(query).sort('date', -1))
 
         return Response({
@@ -100,6 +64,8 @@ class AttendanceListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        from pymongo.errors import DuplicateKeyError
+
         db = get_db()
 
         # Verify employee exists
@@ -118,12 +84,13 @@ class AttendanceListView(APIView):
             }
             result = db.attendance.insert_one(doc)
             doc['_id'] = result.inserted_id
+            publish_change()
 
             return Response(
                 {'success': True, 'data': serialize_attendance(doc), 'message': 'Attendance marked successfully.'},
                 status=status.HTTP_201_CREATED
             )
-        except pymongo.errors.DuplicateKeyError:
+        except DuplicateKeyError:
             return Response(
                 {
                     'success': False,
@@ -140,17 +107,21 @@ class AttendanceDetailView(APIView):
     """
 
     def put(self, request, employee_id, date_str):
-        db = get_db()
-        att_status = request.data.get('status', '').strip()
-        if att_status not in VALID_STATUSES:
+        cleaned, errors = validate_attendance_data({
+            'employee_id': employee_id,
+            'date': date_str,
+            'status': request.data.get('status'),
+        })
+        if errors:
             return Response(
-                {'success': False, 'error': f"Status must be one of: {', '.join(VALID_STATUSES)}."},
+                {'success': False, 'error': 'Validation failed.', 'fields': errors},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        db = get_db()
         result = db.attendance.find_one_and_update(
-            {'employee_id': employee_id.upper(), 'date': date_str},
-            {'$set': {'status': att_status, 'marked_at': datetime.now(timezone.utc)}},
+            {'employee_id': cleaned['employee_id'], 'date': cleaned['date']},
+            {'$set': {'status': cleaned['status'], 'marked_at': datetime.now(timezone.utc)}},
             return_document=True
         )
 
@@ -160,6 +131,7 @@ class AttendanceDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        publish_change()
         return Response({'success': True, 'data': serialize_attendance(result), 'message': 'Attendance updated.'})
 
     def delete(self, request, employee_id, date_str):
@@ -170,6 +142,7 @@ class AttendanceDetailView(APIView):
                 {'success': False, 'error': 'Attendance record not found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        publish_change()
         return Response({'success': True, 'message': 'Attendance record deleted.'})
 
 
@@ -178,9 +151,10 @@ class EmployeeAttendanceSummaryView(APIView):
     GET /api/attendance/summary/<employee_id>/
     Returns total present/absent days and per-month breakdown.
     """
+    read_profile = 'reporting'
 
     def get(self, request, employee_id):
-        db = get_db()
+        db = get_db(self.read_profile)
 
         employee = db.employees.find_one({'employee_id': employee_id.upper()})
         if not employee:
@@ -229,51 +203,78 @@ class BulkAttendanceView(APIView):
     """
 
     def post(self, request):
-        db = get_db()
         records = request.data.get('records', [])
-        date_str = request.data.get('date', '')
+        date_str = str(request.data.get('date') or '').strip()
 
-        if not records:
+        if not records or not isinstance(records, list):
             return Response(
                 {'success': False, 'error': 'No records provided.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        if not date_str or not DATE_REGEX.match(date_str):
+        if check_date(date_str):
             return Response(
                 {'success': False, 'error': 'Valid date is required (YYYY-MM-DD).'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        results = {'created': 0, 'updated': 0, 'errors': []}
+        # The top-level date applies to every record.
+        cleaned_rows, row_errors = validate_attendance_batch([
+            {**record, 'date': date_str} if isinstance(record, dict) else record
+            for record in records
+        ])
 
-        for record in records:
-            employee_id = str(record.get('employee_id', '')).upper()
-            att_status = record.get('status', '')
+        results = {'created': 0, 'updated': 0, 'errors': []}
+        for row_error in row_errors:
+            record = records[row_error['index']]
+            results['errors'].append({
+                'index': row_error['index'],
+                'employee_id': str(record.get('employee_id', '')).upper() if isinstance(record, dict) else '',
+                'error': ' '.join(row_error['fields'].values()),
+                'fields': row_error['fields'],
+            })
+
+        valid = [(index, row) for index, row in enumerate(cleaned_rows) if row is not None]
+        if not valid:
+            return Response({'success': True, 'data': results})
 
-            if att_status not in VALID_STATUSES:
-                results['errors'].append({'employee_id': employee_id, 'error': 'Invalid status.'})
-                continue
+        db = get_db()
+        employee_names = {
+            e['employee_id']: e['full_name']
+            for e in db.employees.find(
+                {'employee_id': {'$in': list({row['employee_id'] for _, row in valid})}},
+                {'employee_id': 1, 'full_name': 1},
+            )
+        }
 
-            employee = db.employees.find_one({'employee_id': employee_id})
-            if not employee:
-                results['errors'].append({'employee_id': employee_id, 'error': 'Employee not found.'})
+        for index, row in valid:
+            employee_id = row['employee_id']
+            if employee_id not in employee_names:
+                results['errors'].append({
+                    'index': index,
+                    'employee_id': employee_id,
+                    'error': 'Employee not found.',
+                    'fields': {'employee_id': 'Employee not found.'},
+                })
                 continue
 
             existing = db.attendance.find_one({'employee_id': employee_id, 'date': date_str})
             if existing:
                 db.attendance.update_one(
                     {'employee_id': employee_id, 'date': date_str},
-                    {'$set': {'status': att_status, 'marked_at': datetime.now(timezone.utc)}}
+                    {'$set': {'status': row['status'], 'marked_at': datetime.now(timezone.utc)}}
                 )
                 results['updated'] += 1
             else:
                 db.attendance.insert_one({
                     'employee_id': employee_id,
-                    'employee_name': employee['full_name'],
+                    'employee_name': employee_names[employee_id],
                     'date': date_str,
-                    'status': att_status,
+                    'status': row['status'],
                     'marked_at': datetime.now(timezone.utc),
                 })
                 results['created'] += 1
 
+        if results['created'] or results['updated']:
+            publish_change()
+        results['errors'].sort(key=lambda e: e['index'])
         return Response({'success': True, 'data': results})
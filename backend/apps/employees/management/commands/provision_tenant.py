@@ -0,0 +1,47 @@
+"""
+Register tenants for multi-tenant deployments.
+
+Requests are only served for provisioned tenants, so a new company's
+database (and its indexes) is created here rather than by the first request
+that names it.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from hrms_project.db import MongoDBConnection, tenant_db_name
+from hrms_project.tenancy import TENANT_REGEX
+
+
+class Command(BaseCommand):
+    help = 'Provision tenant databases (registry entry + indexes), or list provisioned tenants.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenants', nargs='*', help='Tenant names to provision.')
+        parser.add_argument('--list', action='store_true', help='List provisioned tenants.')
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for tenant in MongoDBConnection.provisioned_tenants():
+                self.stdout.write(f'{tenant}\t{tenant_db_name(tenant)}')
+            return
+
+        if not options['tenants']:
+            raise CommandError('Give at least one tenant name, or --list.')
+
+        tenants = [t.strip().lower() for t in options['tenants']]
+        invalid = [t for t in tenants if not TENANT_REGEX.match(t)]
+        if invalid:
+            raise CommandError(
+                f"Invalid tenant name(s): {', '.join(invalid)}. "
+                "Use lowercase letters, digits, '_' and '-' (max 40 characters)."
+            )
+        if settings.TENANTS:
+            blocked = [t for t in tenants if t not in settings.TENANTS]
+            if blocked:
+                raise CommandError(f"Not in the TENANTS allowlist: {', '.join(blocked)}.")
+
+        for tenant in tenants:
+            created = MongoDBConnection.provision_tenant(tenant)
+            state = 'provisioned' if created else 'already provisioned (indexes checked)'
+            self.stdout.write(self.style.SUCCESS(f'{tenant}: {state} -> {tenant_db_name(tenant)}'))
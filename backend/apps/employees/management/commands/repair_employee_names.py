@@ -0,0 +1,98 @@
+"""
+Find and fix drift between employees.full_name and the employee_name copied
+into attendance records.
+
+One aggregation groups attendance by (employee_id, employee_name), so the
+collection is scanned once. The result is compared with a single projection
+of the employees collection. Only employees with drift are rewritten, using
+the same batched propagation as the PATCH endpoint.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.employees.propagation import propagate_employee_name
+from hrms_project.db import MongoDBConnection, TenantNotProvisioned
+
+
+def find_name_drift(db):
+    """
+    Return (drift, orphans).
+    drift maps employee_id -> (current name, stale record count);
+    orphans maps employee_id -> attendance record count with no employee.
+    """
+    names = {
+        e['employee_id']: e['full_name']
+        for e in db.employees.find({}, {'_id': 0, 'employee_id': 1, 'full_name': 1})
+    }
+    pipeline = [
+        {'$group': {
+            '_id': {'employee_id': '$employee_id', 'employee_name': '$employee_name'},
+            'count': {'$sum': 1},
+        }},
+    ]
+    drift = {}
+    orphans = {}
+    for group in db.attendance.aggregate(pipeline, allowDiskUse=True):
+        employee_id = group['_id'].get('employee_id')
+        if employee_id not in names:
+            orphans[employee_id] = orphans.get(employee_id, 0) + group['count']
+        elif group['_id'].get('employee_name') != names[employee_id]:
+            _, stale = drift.get(employee_id, (None, 0))
+            drift[employee_id] = (names[employee_id], stale + group['count'])
+    return drift, orphans
+
+
+class Command(BaseCommand):
+    help = 'Find attendance records whose employee_name differs from the employee and fix them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without writing.')
+        parser.add_argument('--batch-size', type=int, default=settings.NAME_PROPAGATION_BATCH_SIZE)
+        parser.add_argument('--tenant', action='append', default=[],
+                            help='Tenant to repair (repeatable). Requires MULTI_TENANT.')
+        parser.add_argument('--all-tenants', action='store_true',
+                            help='Repair every provisioned tenant.')
+
+    def handle(self, *args, **options):
+        tenants = options['tenant']
+        if settings.MULTI_TENANT:
+            # MONGO_DB_NAME only holds the tenant registry in this mode.
+            if not (tenants or options['all_tenants']):
+                raise CommandError('MULTI_TENANT is enabled; pass --tenant or --all-tenants.')
+        elif tenants or options['all_tenants']:
+            raise CommandError('--tenant/--all-tenants require MULTI_TENANT=True.')
+        if options['all_tenants']:
+            tenants = MongoDBConnection.provisioned_tenants()
+            if not tenants:
+                self.stdout.write('No provisioned tenants found; nothing to repair.')
+                return
+
+        for tenant in tenants or [None]:
+            label = f"tenant '{tenant}'" if tenant else settings.MONGO_DB_NAME
+            try:
+                db = MongoDBConnection.get_db(tenant)
+            except TenantNotProvisioned as exc:
+                raise CommandError(str(exc)) from exc
+            self._repair(db, label, options)
+
+    def _repair(self, db, label, options):
+        drift, orphans = find_name_drift(db)
+        stale_total = sum(count for _, count in drift.values())
+        self.stdout.write(
+            f'{label}: {len(drift)} employee(s) with {stale_total} stale attendance record(s).'
+        )
+        for employee_id, count in sorted(orphans.items(), key=lambda item: str(item[0])):
+            self.stdout.write(self.style.WARNING(
+                f"  {count} attendance record(s) reference missing employee '{employee_id}'."
+            ))
+
+        if options['dry_run']:
+            for employee_id, (name, count) in sorted(drift.items()):
+                self.stdout.write(f"  {employee_id}: {count} record(s) -> '{name}'")
+            return
+
+        fixed = 0
+        for employee_id in sorted(drift):
+            fixed += propagate_employee_name(db, employee_id, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{label}: {fixed} attendance record(s) updated.'))
@@ -0,0 +1,67 @@
+"""
+Propagation of the denormalized employee name into attendance records.
+
+Attendance documents copy `employee_name` when they are written. After a
+rename the copies are rewritten in small batches, so no single write touches
+the whole attendance collection. Each batch re-reads the employee's current
+name, so overlapping renames converge on the latest one.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def propagate_employee_name(db, employee_id, batch_size=None, pause=None):
+    """
+    Rewrite attendance.employee_name for one employee in batches.
+    Returns the number of attendance records updated.
+    """
+    batch_size = batch_size or settings.NAME_PROPAGATION_BATCH_SIZE
+    pause = settings.NAME_PROPAGATION_PAUSE_SECONDS if pause is None else pause
+    updated = 0
+    while True:
+        employee = db.employees.find_one({'employee_id': employee_id}, {'full_name': 1})
+        if not employee:
+            break
+        stale = {'employee_id': employee_id, 'employee_name': {'$ne': employee['full_name']}}
+        ids = [doc['_id'] for doc in db.attendance.find(stale, {'_id': 1}).limit(batch_size)]
+        if not ids:
+            break
+        result = db.attendance.update_many(
+            {'_id': {'$in': ids}, **stale},
+            {'$set': {'employee_name': employee['full_name']}}
+        )
+        updated += result.modified_count
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return updated
+
+
+def _run(db, employee_id):
+    try:
+        updated = propagate_employee_name(db, employee_id)
+        logger.info("Propagated name of employee '%s' to %d attendance record(s).", employee_id, updated)
+    except Exception:
+        # The repair_employee_names command fixes whatever is left behind.
+        logger.exception("Name propagation failed for employee '%s'.", employee_id)
+
+
+def schedule_name_propagation(db, employee_id):
+    """Run propagate_employee_name in the background; one job at a time per process."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='name-propagation')
+    return _executor.submit(_run, db, employee_id)
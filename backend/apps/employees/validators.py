@@ -1,9 +1,14 @@
 """
 Validation utilities for employee data.
+
+_validate_employee_row() holds the per-record rules. validate_employee_data()
+applies them to one record for the create and update endpoints, returning the
+fields that passed even when others failed (PATCH relies on this).
+validate_employee_batch() applies them to a list of records in one pass and
+is used by benchmarks/validation.py.
 """
 
 import re
-from datetime import datetime
 
 EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$')
 
@@ -20,20 +25,28 @@ DEPARTMENTS = [
     'Customer Support',
 ]
 
+DEPARTMENT_SET = frozenset(DEPARTMENTS)
 
-def validate_employee_data(data, is_update=False):
-    """
-    Validate employee creation/update data.
-    Returns (cleaned_data, errors) tuple.
-    errors is a dict of field -> error message, or empty dict if valid.
-    """
+
+def clean_text(value):
+    """Stripped request string; '' for missing values, None for non-strings."""
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        return None
+    return value.strip()
+
+
+def _validate_employee_row(data, is_update):
     errors = {}
     cleaned = {}
 
     # employee_id
-    employee_id = data.get('employee_id', '').strip()
+    employee_id = clean_text(data.get('employee_id'))
     if not is_update:
-        if not employee_id:
+        if employee_id is None:
+            errors['employee_id'] = 'Employee ID must be a string.'
+        elif not employee_id:
             errors['employee_id'] = 'Employee ID is required.'
         elif len(employee_id) < 2 or len(employee_id) > 20:
             errors['employee_id'] = 'Employee ID must be between 2 and 20 characters.'
@@ -41,8 +54,10 @@ def validate_employee_data(data, is_update=False):
             cleaned['employee_id'] = employee_id.upper()
 
     # full_name
-    full_name = data.get('full_name', '').strip()
-    if not full_name:
+    full_name = clean_text(data.get('full_name'))
+    if full_name is None:
+        errors['full_name'] = 'Full name must be a string.'
+    elif not full_name:
         errors['full_name'] = 'Full name is required.'
     elif len(full_name) < 2 or len(full_name) > 100:
         errors['full_name'] = 'Full name must be between 2 and 100 characters.'
@@ -50,19 +65,60 @@ def validate_employee_data(data, is_update=False):
         cleaned['full_name'] = full_name
 
     # email
-    email = data.get('email', '').strip().lower()
-    if not email:
+    email = clean_text(data.get('email'))
+    if email is None:
+        errors['email'] = 'Email address must be a string.'
+    elif not email:
         errors['email'] = 'Email address is required.'
     elif not EMAIL_REGEX.match(email):
         errors['email'] = 'Please provide a valid email address.'
     else:
-        cleaned['email'] = email
+        cleaned['email'] = email.lower()
 
     # department
-    department = data.get('department', '').strip()
-    if not department:
+    department = clean_text(data.get('department'))
+    if department is None:
+        errors['department'] = 'Department must be a string.'
+    elif not department:
         errors['department'] = 'Department is required.'
+    elif department not in DEPARTMENT_SET:
+        errors['department'] = f"Department must be one of: {', '.join(DEPARTMENTS)}."
     else:
         cleaned['department'] = department
 
     return cleaned, errors
+
+
+def validate_employee_batch(records, is_update=False):
+    """
+    Validate a list of employee records in one pass.
+    Returns (cleaned_rows, row_errors) tuple.
+    cleaned_rows is aligned with records and holds the cleaned dict, or None
+    for rows that failed. row_errors is a list of {'index': i, 'fields': {...}}.
+    """
+    cleaned_rows = []
+    row_errors = []
+    for index, data in enumerate(records):
+        if not isinstance(data, dict):
+            cleaned_rows.append(None)
+            row_errors.append({'index': index, 'fields': {'record': 'Record must be an object.'}})
+            continue
+        cleaned, errors = _validate_employee_row(data, is_update)
+        if errors:
+            cleaned_rows.append(None)
+            row_errors.append({'index': index, 'fields': errors})
+        else:
+            cleaned_rows.append(cleaned)
+    return cleaned_rows, row_errors
+
+
+def validate_employee_data(data, is_update=False):
+    """
+    Validate employee creation/update data.
+    Returns (cleaned_data, errors) tuple.
+    errors is a dict of field -> error message, or empty dict if valid.
+    cleaned_data holds every field that passed, even when others failed.
+    """
+    if not isinstance(data, dict):
+        return {}, {'record': 'Record must be an object.'}
+    return _validate_employee_row(data, is_update)
@@ -3,16 +3,22 @@ Employee API Views for HRMS Lite.
 Handles CRUD operations for employees using pymongo directly.
 """
 
-from datetime import datetime, timezone
-from bson import ObjectId
-import pymongo.errors
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timezone
 
+from django.conf import settings
 from rest_framework.views import APIView
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework import status
 
 from hrms_project.db import get_db
-from .validators import validate_employee_data, DEPARTMENTS
+from hrms_project.events import publish_change
+from hrms_project.sse import EventStreamRenderer, event_stream, sse_response
+from hrms_project.tenancy import get_current_tenant
+from .propagation import schedule_name_propagation
+from .validators import clean_text, validate_employee_data, DEPARTMENTS
 
 
 def serialize_employee(doc):
@@ -66,6 +72,8 @@ class EmployeeListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        from pymongo.errors import DuplicateKeyError
+
         db = get_db()
         try:
             doc = {
@@ -74,12 +82,13 @@ class EmployeeListView(APIView):
             }
             result = db.employees.insert_one(doc)
             doc['_id'] = result.inserted_id
+            publish_change()
 
             return Response(
                 {'success': True, 'data': serialize_employee(doc), 'message': 'Employee created successfully.'},
                 status=status.HTTP_201_CREATED
             )
-        except pymongo.errors.DuplicateKeyError as e:
+        except DuplicateKeyError as e:
             key_value = e.details.get('keyValue', {})
             if 'employee_id' in key_value:
                 msg = f"Employee ID '{cleaned.get('employee_id')}' is already taken."
@@ -96,6 +105,7 @@ class EmployeeListView(APIView):
 class EmployeeDetailView(APIView):
     """
     GET    /api/employees/<employee_id>/   - Get employee details
+    PATCH  /api/employees/<employee_id>/   - Update name, email or department
     DELETE /api/employees/<employee_id>/   - Delete employee
     """
 
@@ -112,6 +122,74 @@ class EmployeeDetailView(APIView):
             )
         return Response({'success': True, 'data': serialize_employee(employee)})
 
+    def patch(self, request, employee_id):
+        if not isinstance(request.data, dict):
+            return Response(
+                {'success': False, 'error': 'Validation failed.', 'fields': {'record': 'Record must be an object.'}},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        db = get_db()
+        employee = self._get_employee(db, employee_id)
+        if not employee:
+            return Response(
+                {'success': False, 'error': f"Employee '{employee_id}' not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        # Omitted fields keep their current values; employee_id cannot change.
+        # Only fields the client sent with a new value are checked, so stored
+        # values that predate a validation rule (e.g. a department no longer
+        # listed) do not block unrelated edits.
+        current = {field: employee[field] for field in ('full_name', 'email', 'department')}
+        sent = {
+            field for field in current.keys() & request.data.keys()
+            if clean_text(request.data[field]) != current[field]
+        }
+        cleaned, errors = validate_employee_data({**current, **request.data}, is_update=True)
+        errors = {field: message for field, message in errors.items() if field in sent}
+        if errors:
+            return Response(
+                {'success': False, 'error': 'Validation failed.', 'fields': errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        changes = {
+            field: cleaned[field] for field in sent
+            if employee[field] != cleaned[field]
+        }
+        if not changes:
+            return Response({'success': True, 'data': serialize_employee(employee), 'message': 'No changes.'})
+
+        from pymongo import ReturnDocument
+        from pymongo.errors import DuplicateKeyError
+
+        try:
+            updated = db.employees.find_one_and_update(
+                {'_id': employee['_id']},
+                {'$set': changes},
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            return Response(
+                {'success': False, 'error': f"Email '{cleaned['email']}' is already registered."},
+                status=status.HTTP_409_CONFLICT
+            )
+        if not updated:
+            return Response(
+                {'success': False, 'error': f"Employee '{employee_id}' not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        message = 'Employee updated successfully.'
+        if 'full_name' in changes:
+            # Attendance records carry a copy of the name; rewrite them in batches.
+            schedule_name_propagation(db, updated['employee_id'])
+            message += ' Attendance records are being updated in the background.'
+        publish_change()
+
+        return Response({'success': True, 'data': serialize_employee(updated), 'message': message})
+
     def delete(self, request, employee_id):
         db = get_db()
         employee = self._get_employee(db, employee_id)
@@ -124,6 +202,7 @@ class EmployeeDetailView(APIView):
         db.employees.delete_one({'employee_id': employee_id})
         # Also delete all attendance records for this employee
         deleted_attendance = db.attendance.delete_many({'employee_id': employee_id})
+        publish_change()
 
         return Response({
             'success': True,
@@ -138,43 +217,101 @@ class DepartmentListView(APIView):
         return Response({'success': True, 'data': DEPARTMENTS})
 
 
+def dashboard_summary(db):
+    """Compute the dashboard payload: headcount, departments and today's attendance."""
+    total_employees = db.employees.count_documents({})
+
+    # Department breakdown
+    pipeline = [
+        {'$group': {'_id': '$department', 'count': {'$sum': 1}}},
+        {'$sort': {'count': -1}},
+    ]
+    dept_breakdown = [
+        {'department': d['_id'], 'count': d['count']}
+        for d in db.employees.aggregate(pipeline)
+    ]
+
+    # Attendance stats for today
+    today_str = date.today().isoformat()
+    today_present = db.attendance.count_documents({'date': today_str, 'status': 'Present'})
+    today_absent = db.attendance.count_documents({'date': today_str, 'status': 'Absent'})
+
+    # Total attendance records
+    total_attendance = db.attendance.count_documents({})
+
+    return {
+        'total_employees': total_employees,
+        'department_breakdown': dept_breakdown,
+        'today': {
+            'date': today_str,
+            'present': today_present,
+            'absent': today_absent,
+            'not_marked': max(0, total_employees - today_present - today_absent),
+        },
+        'total_attendance_records': total_attendance,
+    }
+
+
+class _DashboardCacheEntry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.key = None
+        self.payload = None
+
+
+# tenant -> entry holding ((change version, date), payload). Every open stream
+# of a tenant shares one computation per change instead of querying per
+# connection. Bounded like the tenant database map; each tenant has its own
+# lock so one tenant's refresh never waits on another's.
+_dashboard_cache = OrderedDict()
+_dashboard_cache_lock = threading.Lock()
+
+
+def _dashboard_cache_entry(tenant):
+    with _dashboard_cache_lock:
+        entry = _dashboard_cache.get(tenant)
+        if entry is None:
+            entry = _dashboard_cache[tenant] = _DashboardCacheEntry()
+        _dashboard_cache.move_to_end(tenant)
+        while len(_dashboard_cache) > settings.TENANT_DB_CACHE_SIZE:
+            _dashboard_cache.popitem(last=False)
+        return entry
+
+
+def cached_dashboard_summary(tenant, db, version):
+    key = (version, date.today())
+    entry = _dashboard_cache_entry(tenant)
+    with entry.lock:
+        if entry.key != key:
+            entry.payload = dashboard_summary(db)
+            entry.key = key
+        return entry.payload
+
+
 class DashboardView(APIView):
     """GET /api/dashboard/ - Summary statistics"""
+    read_profile = 'reporting'
 
     def get(self, request):
-        db = get_db()
-        total_employees = db.employees.count_documents({})
-
-        # Department breakdown
-        pipeline = [
-            {'$group': {'_id': '$department', 'count': {'$sum': 1}}},
-            {'$sort': {'count': -1}},
-        ]
-        dept_breakdown = [
-            {'department': d['_id'], 'count': d['count']}
-            for d in db.employees.aggregate(pipeline)
-        ]
-
-        # Attendance stats for today
-        from datetime import date
-        today_str = date.today().isoformat()
-        today_present = db.attendance.count_documents({'date': today_str, 'status': 'Present'})
-        today_absent = db.attendance.count_documents({'date': today_str, 'status': 'Absent'})
-
-        # Total attendance records
-        total_attendance = db.attendance.count_documents({})
+        return Response({'success': True, 'data': dashboard_summary(get_db(self.read_profile))})
 
-        return Response({
-            'success': True,
-            'data': {
-                'total_employees': total_employees,
-                'department_breakdown': dept_breakdown,
-                'today': {
-                    'date': today_str,
-                    'present': today_present,
-                    'absent': today_absent,
-                    'not_marked': max(0, total_employees - today_present - today_absent),
-                },
-                'total_attendance_records': total_attendance,
-            }
-        })
+
+class DashboardStreamView(APIView):
+    """
+    GET /api/dashboard/stream - Server-Sent Events feed of the dashboard summary.
+    Sends the DashboardView payload on connect and again after each change.
+    """
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request):
+        # Resolve tenant and database now: the stream is consumed after the
+        # middleware has unbound the request's tenant. Reads stay on the
+        # primary so a pushed update always reflects the write that caused it.
+        tenant = get_current_tenant()
+        db = get_db()
+        stream = event_stream(
+            tenant,
+            lambda version: cached_dashboard_summary(tenant, db, version),
+            event='dashboard',
+        )
+        return sse_response(stream)
@@ -0,0 +1,132 @@
+"""
+Read-routing check: records which server every MongoDB command of each
+endpoint was sent to.
+
+Point MONGO_URI at a local replica set, e.g. three mongod processes started
+with --replSet rs0 and initiated with rs.initiate(), then:
+
+    MONGO_URI='mongodb://localhost:27017,localhost:27018,localhost:27019/?replicaSet=rs0' \
+        python benchmarks/read_routing.py
+
+Write endpoints and read-your-write reads must reach the primary; endpoints
+with read_profile = 'reporting' should reach a secondary when the profile's
+mode allows it. Against a standalone server everything lands on the one
+server and only the requested read preference is shown.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from datetime import date
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hrms_project.settings_lean')
+os.environ['MULTI_TENANT'] = 'False'
+os.environ['MONGO_DB_NAME'] = 'hrms_routingcheck'
+
+import django  # noqa: E402
+
+django.setup()
+
+import pymongo  # noqa: E402
+from pymongo import monitoring  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from hrms_project.db import MongoDBConnection  # noqa: E402
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Collects (command, server address, $readPreference) per started command."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.commands = []
+
+    def started(self, event):
+        if event.database_name != settings.MONGO_DB_NAME:
+            return
+        read_pref = event.command.get('$readPreference', {}).get('mode', '-')
+        with self.lock:
+            self.commands.append((event.command_name, event.connection_id, read_pref))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def take(self):
+        with self.lock:
+            commands, self.commands = self.commands, []
+        return commands
+
+
+# (label, method, path, body, expected route)
+ENDPOINTS = (
+    ('create employee', 'post', '/api/employees/',
+     {'employee_id': 'RT001', 'full_name': 'Routing Check', 'email': 'rt001@example.com',
+      'department': 'Engineering'}, 'primary'),
+    ('mark attendance', 'post', '/api/attendance/',
+     {'employee_id': 'RT001', 'date': date.today().isoformat(), 'status': 'Present'}, 'primary'),
+    ('list employees', 'get', '/api/employees/', None, 'primary'),
+    ('attendance today', 'get', f'/api/attendance/?date={date.today().isoformat()}', None, 'primary'),
+    ('attendance month', 'get', f'/api/attendance/?month={date.today():%Y-%m}', None, 'reporting'),
+    ('employee summary', 'get', '/api/attendance/summary/RT001/', None, 'reporting'),
+    ('dashboard', 'get', '/api/dashboard/', None, 'reporting'),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--settle', type=float, default=1.0,
+                        help='Seconds to wait after writes so secondaries catch up.')
+    args = parser.parse_args()
+
+    recorder = CommandRecorder()
+    client = MongoDBConnection._client = pymongo.MongoClient(
+        settings.MONGO_URI,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        event_listeners=[recorder],
+    )
+    client.drop_database(settings.MONGO_DB_NAME)
+    MongoDBConnection.get_db()
+    recorder.take()
+
+    reporting = settings.READ_PROFILES['reporting']
+    print(f"reporting profile: mode={reporting['mode']} "
+          f"max_staleness={reporting['max_staleness_seconds']}s")
+    client.admin.command('ping')
+    primary, secondaries = client.primary, client.secondaries
+    print(f'primary: {primary}  secondaries: {sorted(secondaries) or "none"}')
+
+    can_offload = bool(secondaries) and reporting['mode'] in ('secondary', 'secondaryPreferred')
+    http = Client(SERVER_NAME='localhost')
+    mismatches = 0
+    for label, method, path, body, expected in ENDPOINTS:
+        if method == 'get':
+            response = http.get(path)
+        else:
+            response = http.post(path, body, content_type='application/json')
+            time.sleep(args.settle)
+        for command, address, read_pref in recorder.take():
+            role = 'primary' if address == primary else 'secondary' if address in secondaries else 'other'
+            wrong = (
+                (expected == 'primary' and role != 'primary')
+                or (expected == 'reporting' and can_offload and role != 'secondary')
+            )
+            mismatches += wrong
+            print(f'  {label:<18}{response.status_code:<5}{command:<16}{address[0]}:{address[1]:<7}'
+                  f'{role:<11}$readPreference={read_pref:<20}{"UNEXPECTED" if wrong else ""}')
+
+    client.drop_database(settings.MONGO_DB_NAME)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Startup-time and per-request-overhead benchmark for the settings profiles.
+
+Each profile is measured in fresh interpreters so import caches do not leak
+between runs. The request loop hits GET /api/departments/, which does not
+touch MongoDB, so the numbers isolate Django/DRF/middleware overhead.
+
+Usage (from backend/):
+    python benchmarks/startup.py [--runs 5] [--requests 2000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROFILES = (
+    'hrms_project.settings',
+    'hrms_project.settings_lean',
+)
+
+
+def _environ(path):
+    import io
+    return {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '8000',
+        'HTTP_HOST': 'localhost',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+    }
+
+
+def _measure(requests):
+    """Run inside a child interpreter; prints a JSON result line."""
+    start = time.perf_counter()
+    from django.core.wsgi import get_wsgi_application
+    application = get_wsgi_application()
+    setup_done = time.perf_counter()
+
+    def call(path):
+        statuses = []
+        body = application(_environ(path), lambda s, h: statuses.append(s))
+        b''.join(body)
+        body.close()
+        return statuses[0]
+
+    status = call('/api/departments/')
+    first_response = time.perf_counter()
+    assert status.startswith('200'), status
+
+    loop_start = time.perf_counter()
+    for _ in range(requests):
+        call('/api/departments/')
+    loop_end = time.perf_counter()
+
+    print(json.dumps({
+        'setup_ms': (setup_done - start) * 1000,
+        'first_response_ms': (first_response - start) * 1000,
+        'per_request_us': (loop_end - loop_start) / requests * 1e6,
+        'modules': len(sys.modules),
+    }))
+
+
+def _run_child(profile, requests):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=profile, DEBUG='False')
+    out = subprocess.run(
+        [sys.executable, __file__, '--child', '--requests', str(requests)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, BACKEND_DIR)
+        _measure(args.requests)
+        return
+
+    header = f"{'profile':<30}{'setup ms':>10}{'first resp ms':>15}{'req us':>10}{'modules':>9}"
+    print(header)
+    print('-' * len(header))
+    for profile in PROFILES:
+        runs = [_run_child(profile, args.requests) for _ in range(args.runs)]
+
+        def median(key):
+            return statistics.median(r[key] for r in runs)
+
+        print(
+            f"{profile:<30}{median('setup_ms'):>10.1f}{median('first_response_ms'):>15.1f}"
+            f"{median('per_request_us'):>10.1f}{median('modules'):>9.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Multi-tenant load test against a local MongoDB.
+
+Every tenant creates the same employee IDs concurrently through the API, so
+any cross-tenant leak shows up as a 409 or as a foreign name in a listing.
+A pool listener on the shared client reports how many connections were
+opened versus how many checkouts they served.
+
+Usage (from backend/, with MongoDB on MONGO_URI):
+    python benchmarks/tenants.py [--tenants 8] [--employees 50] [--workers 32]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hrms_project.settings_lean')
+os.environ['MULTI_TENANT'] = 'True'
+os.environ['TENANT_RESOLVER'] = 'header'
+os.environ['MONGO_DB_NAME'] = 'hrms_loadtest'
+
+import django  # noqa: E402
+
+django.setup()
+
+import pymongo  # noqa: E402
+from pymongo import monitoring  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from hrms_project.db import MongoDBConnection, tenant_db_name  # noqa: E402
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = 0
+        self.checked_out = 0
+
+    def connection_created(self, event):
+        with self.lock:
+            self.created += 1
+
+    def connection_checked_out(self, event):
+        with self.lock:
+            self.checked_out += 1
+
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_closed(self, event): pass
+    def connection_check_out_started(self, event): pass
+    def connection_check_out_failed(self, event): pass
+    def connection_checked_in(self, event): pass
+
+
+def create_employee(tenant, index):
+    client = Client(headers={settings.TENANT_HEADER: tenant}, SERVER_NAME='localhost')
+    response = client.post('/api/employees/', {
+        'employee_id': f'EMP{index:04d}',
+        'full_name': f'{tenant} Employee {index}',
+        'email': f'emp{index}@example.com',
+        'department': 'Engineering',
+    }, content_type='application/json')
+    return tenant, response.status_code
+
+
+def check_isolation(tenant):
+    client = Client(headers={settings.TENANT_HEADER: tenant}, SERVER_NAME='localhost')
+    data = client.get('/api/employees/').json()
+    foreign = [e for e in data['data'] if not e['full_name'].startswith(f'{tenant} ')]
+    return tenant, data['total'], foreign
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=8)
+    parser.add_argument('--employees', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--keep', action='store_true', help='Keep the tenant databases afterwards.')
+    args = parser.parse_args()
+
+    stats = PoolStats()
+    MongoDBConnection._client = pymongo.MongoClient(
+        settings.MONGO_URI,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        event_listeners=[stats],
+    )
+    tenants = [f'loadtest{i}' for i in range(args.tenants)]
+    mongo = MongoDBConnection.get_client()
+    for tenant in tenants:
+        mongo.drop_database(tenant_db_name(tenant))
+        MongoDBConnection.provision_tenant(tenant)
+
+    jobs = [(t, i) for i in range(args.employees) for t in tenants]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(lambda job: create_employee(*job), jobs))
+    elapsed = time.perf_counter() - started
+
+    failures = [r for r in results if r[1] != 201]
+    print(f'{len(jobs)} writes across {len(tenants)} tenants in {elapsed:.2f}s '
+          f'({len(jobs) / elapsed:.0f} req/s), {len(failures)} failed')
+
+    isolated = True
+    for tenant, total, foreign in map(check_isolation, tenants):
+        ok = total == args.employees and not foreign
+        isolated &= ok
+        print(f'  {tenant:<12} {tenant_db_name(tenant):<26} employees={total:<5} '
+              f'foreign={len(foreign):<3} {"ok" if ok else "LEAK"}')
+
+    print(f'tenant handles cached: {len(MongoDBConnection._tenant_dbs)}')
+    print(f'pool: {stats.created} connections opened for {stats.checked_out} checkouts')
+
+    if not args.keep:
+        for tenant in tenants:
+            mongo.drop_database(tenant_db_name(tenant))
+        MongoDBConnection.tenant_registry().delete_many({'_id': {'$in': tenants}})
+
+    if failures or not isolated:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Validation benchmark: 100k rows through the batch validators versus the
+same rows validated one record at a time.
+
+Pure Python, no database or Django setup needed.
+
+Usage (from backend/):
+    python benchmarks/validation.py [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from apps.attendance.validators import validate_attendance_batch, validate_attendance_data  # noqa: E402
+from apps.employees.validators import DEPARTMENTS, validate_employee_batch, validate_employee_data  # noqa: E402
+
+
+def make_attendance(rows, rng):
+    # A month of dates, a few percent invalid rows of each kind.
+    dates = [f'2026-03-{day:02d}' for day in range(1, 32)] + ['2026-02-30', '03/01/2026']
+    return [
+        {
+            'employee_id': f'emp{rng.randrange(5000):04d}',
+            'date': rng.choice(dates),
+            'status': rng.choice(('Present', 'Absent', 'Present', 'Late')) if rng.random() < 0.05
+            else rng.choice(('Present', 'Absent')),
+        }
+        for _ in range(rows)
+    ]
+
+
+def make_employees(rows, rng):
+    departments = DEPARTMENTS + ['Unknown']
+    return [
+        {
+            'employee_id': f'EMP{i:06d}',
+            'full_name': f'  Employee {i}  ',
+            'email': f'employee{i}@example.com' if rng.random() > 0.02 else 'not-an-email',
+            'department': rng.choice(departments),
+        }
+        for i in range(rows)
+    ]
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = (
+        ('attendance', make_attendance(args.rows, rng), validate_attendance_batch, validate_attendance_data),
+        ('employees', make_employees(args.rows, rng), validate_employee_batch, validate_employee_data),
+    )
+
+    print(f"{'dataset':<12}{'mode':<10}{'total ms':>10}{'us/row':>9}{'errors':>9}")
+    for name, records, batch, single in cases:
+        elapsed, (_, row_errors) = best_of(args.repeat, lambda: batch(records))
+        print(f"{name:<12}{'batch':<10}{elapsed * 1000:>10.1f}{elapsed / args.rows * 1e6:>9.2f}{len(row_errors):>9}")
+
+        elapsed, results = best_of(args.repeat, lambda: [single(r) for r in records])
+        errors = sum(1 for _, e in results if e)
+        print(f"{name:<12}{'per-row':<10}{elapsed * 1000:>10.1f}{elapsed / args.rows * 1e6:>9.2f}{errors:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,34 +1,171 @@
 """
 MongoDB connection utility using pymongo.
-Provides a singleton database connection.
+Provides a singleton client shared by every database handle.
+
+In single-tenant mode all requests use settings.MONGO_DB_NAME. With
+MULTI_TENANT enabled, each tenant gets its own database on the same client
+(and therefore the same connection pool); handles are cached in a bounded
+LRU map. Tenants must be provisioned explicitly (manage.py provision_tenant),
+which records them in the registry collection of settings.MONGO_DB_NAME;
+requests for unregistered tenants never create a database.
+
+Reads can be routed away from the primary: get_db('reporting') returns the
+same database with the read preference configured in
+settings.READ_PROFILES['reporting']. Writes and read-your-write flows call
+get_db() and stay on the primary. MongoDBConnection.get_db() takes a tenant
+as its first argument, so there the profile is keyword-only (read_profile=).
+
+pymongo is imported on first use so that worker startup (and endpoints that
+never touch the database) do not pay for it.
 """
 
-import pymongo
+import threading
+from collections import OrderedDict
+
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .tenancy import get_current_tenant
+
+
+TENANTS_COLLECTION = 'tenants'
+
+
+class TenantNotProvisioned(LookupError):
+    pass
+
+
+def tenant_db_name(tenant):
+    """Database name used for a tenant: <MONGO_DB_NAME>_<tenant>."""
+    return f'{settings.MONGO_DB_NAME}_{tenant}'
+
+
+PRIMARY = 'primary'
+
+
+def _make_read_preference(name):
+    from pymongo import read_preferences
+
+    modes = {
+        'primary': read_preferences.Primary,
+        'primaryPreferred': read_preferences.PrimaryPreferred,
+        'secondary': read_preferences.Secondary,
+        'secondaryPreferred': read_preferences.SecondaryPreferred,
+        'nearest': read_preferences.Nearest,
+    }
+    profile = settings.READ_PROFILES.get(name)
+    if profile is None:
+        raise ImproperlyConfigured(f"Unknown read profile '{name}'.")
+    mode = modes.get(profile['mode'])
+    if mode is None:
+        raise ImproperlyConfigured(
+            f"Read profile '{name}' has invalid mode '{profile['mode']}'. "
+            f"Use one of: {', '.join(modes)}."
+        )
+    if mode is read_preferences.Primary:
+        return mode()
+    max_staleness = profile.get('max_staleness_seconds', -1)
+    # MongoDB rejects limits below 90s (at query time, as a ConfigurationError).
+    if max_staleness != -1 and max_staleness < 90:
+        raise ImproperlyConfigured(
+            f"Read profile '{name}' has max_staleness_seconds={max_staleness}. "
+            "Use -1 (no limit) or at least 90."
+        )
+    return mode(max_staleness=max_staleness)
 
 
 class MongoDBConnection:
     _client = None
     _db = None
+    _tenant_dbs = OrderedDict()
+    _read_preferences = {}
+    _lock = threading.Lock()
 
     @classmethod
     def get_client(cls):
         if cls._client is None:
-            cls._client = pymongo.MongoClient(settings.MONGO_URI)
+            import pymongo
+            cls._client = pymongo.MongoClient(
+                settings.MONGO_URI,
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            )
         return cls._client
 
     @classmethod
-    def get_db(cls):
-        if cls._db is None:
-            client = cls.get_client()
-            cls._db = client[settings.MONGO_DB_NAME]
-            cls._ensure_indexes()
-        return cls._db
+    def get_db(cls, tenant=None, *, read_profile=PRIMARY):
+        if tenant is not None:
+            db = cls.get_tenant_db(tenant)
+            if db is None:
+                raise TenantNotProvisioned(f"Tenant '{tenant}' is not provisioned.")
+        else:
+            if cls._db is None:
+                client = cls.get_client()
+                cls._db = client[settings.MONGO_DB_NAME]
+                cls._ensure_indexes(cls._db)
+            db = cls._db
+        if read_profile == PRIMARY:
+            return db
+        return db.with_options(read_preference=cls.get_read_preference(read_profile))
+
+    @classmethod
+    def get_read_preference(cls, read_profile):
+        """Read preference for a profile in settings.READ_PROFILES (built once)."""
+        preference = cls._read_preferences.get(read_profile)
+        if preference is None:
+            preference = _make_read_preference(read_profile)
+            cls._read_preferences[read_profile] = preference
+        return preference
+
+    @classmethod
+    def get_tenant_db(cls, tenant):
+        """Return the cached database handle for a tenant, or None if it is not provisioned."""
+        with cls._lock:
+            db = cls._tenant_dbs.get(tenant)
+            if db is not None:
+                cls._tenant_dbs.move_to_end(tenant)
+                return db
+
+        if cls.tenant_registry().find_one({'_id': tenant}, {'_id': 1}) is None:
+            return None
+        # Index creation is idempotent, so concurrent first requests for the
+        # same tenant may both run it without holding the lock.
+        db = cls.get_client()[tenant_db_name(tenant)]
+        cls._ensure_indexes(db)
+
+        with cls._lock:
+            cls._tenant_dbs[tenant] = db
+            cls._tenant_dbs.move_to_end(tenant)
+            while len(cls._tenant_dbs) > settings.TENANT_DB_CACHE_SIZE:
+                cls._tenant_dbs.popitem(last=False)
+        return db
+
+    @classmethod
+    def tenant_registry(cls):
+        """Collection listing provisioned tenants ({'_id': <tenant>, 'created_at': ...})."""
+        return cls.get_client()[settings.MONGO_DB_NAME][TENANTS_COLLECTION]
+
+    @classmethod
+    def provision_tenant(cls, tenant):
+        """Register a tenant and create its indexes. Returns False if it already existed."""
+        from datetime import datetime, timezone
+
+        db = cls.get_client()[tenant_db_name(tenant)]
+        cls._ensure_indexes(db)
+        result = cls.tenant_registry().update_one(
+            {'_id': tenant},
+            {'$setOnInsert': {'created_at': datetime.now(timezone.utc)}},
+            upsert=True
+        )
+        return result.upserted_id is not None
+
+    @classmethod
+    def provisioned_tenants(cls):
+        return sorted(doc['_id'] for doc in cls.tenant_registry().find({}, {'_id': 1}))
 
     @classmethod
-    def _ensure_indexes(cls):
+    def _ensure_indexes(cls, db):
         """Create indexes for performance and uniqueness constraints."""
-        db = cls._db
+        import pymongo
         # Unique index on employee_id
         db.employees.create_index('employee_id', unique=True)
         # Unique index on email
@@ -44,6 +181,9 @@ class MongoDBConnection:
         db.attendance.create_index('employee_id')
 
 
-def get_db():
-    """Convenience function to get the database instance."""
-    return MongoDBConnection.get_db()
+def get_db(read_profile=PRIMARY):
+    """
+    Convenience function to get the database instance for the current tenant.
+    Pass a read profile (e.g. 'reporting') for reads that tolerate staleness.
+    """
+    return MongoDBConnection.get_db(get_current_tenant(), read_profile=read_profile)
@@ -0,0 +1,191 @@
+"""
+Change notifications for live dashboard updates.
+
+Write endpoints call publish_change() after a successful write. Each tenant
+has a version counter; readers block in wait() until it moves past the
+version they last saw. The channel is chosen by settings.EVENT_CHANNEL:
+
+- 'memory' (default): versions live in this process. Enough for a single
+  worker process and for local development.
+- 'mongo': publish_change() inserts into a capped collection in the tenant's
+  database, and every process tails it (one thread per tenant with open
+  streams). Tailable cursors work on a standalone server, so no replica set
+  is required.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+
+from .db import MongoDBConnection
+from .tenancy import get_current_tenant
+
+logger = logging.getLogger(__name__)
+
+EVENTS_COLLECTION = 'change_events'
+EVENTS_COLLECTION_BYTES = 1024 * 1024
+
+
+class InProcessChannel:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._versions = {}
+
+    def publish(self, tenant):
+        with self._cond:
+            self._versions[tenant] = self._versions.get(tenant, 0) + 1
+            self._cond.notify_all()
+
+    def subscribe(self, tenant):
+        """Called when a stream for the tenant opens; pair with unsubscribe()."""
+
+    def unsubscribe(self, tenant):
+        """Called when a stream for the tenant closes."""
+
+    def version(self, tenant):
+        with self._cond:
+            return self._versions.get(tenant, 0)
+
+    def wait(self, tenant, since, timeout):
+        """Block until the tenant's version differs from `since` or timeout; return the version."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._versions.get(tenant, 0) != since, timeout)
+            return self._versions.get(tenant, 0)
+
+
+class MongoChannel(InProcessChannel):
+    """
+    Cross-process channel backed by a tailed capped collection.
+    Open streams are counted per tenant; a tenant's tailer thread starts with
+    its first stream and exits once the last one has closed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._streams = {}
+        self._tailed = set()
+        self._tailed_lock = threading.Lock()
+        self._prepared = set()
+
+    def publish(self, tenant):
+        # The local version is bumped by this process's tailer, like everyone else's.
+        db = MongoDBConnection.get_db(tenant)
+        self._ensure_collection(db)
+        db[EVENTS_COLLECTION].insert_one({'at': datetime.now(timezone.utc)})
+
+    def subscribe(self, tenant):
+        with self._tailed_lock:
+            self._streams[tenant] = self._streams.get(tenant, 0) + 1
+            if tenant in self._tailed:
+                return
+            self._tailed.add(tenant)
+        threading.Thread(
+            target=self._tail, args=(tenant,), name=f'events-tail-{tenant}', daemon=True
+        ).start()
+
+    def unsubscribe(self, tenant):
+        with self._tailed_lock:
+            remaining = self._streams.get(tenant, 0) - 1
+            if remaining > 0:
+                self._streams[tenant] = remaining
+            else:
+                self._streams.pop(tenant, None)
+
+    def _keep_tailing(self, tenant):
+        """True while the tenant has open streams; otherwise deregister the tailer."""
+        with self._tailed_lock:
+            if self._streams.get(tenant):
+                return True
+            self._tailed.discard(tenant)
+            return False
+
+    def _ensure_collection(self, db):
+        """
+        Create the capped events collection once per database. An insert into
+        a missing collection would create it uncapped, which cannot be tailed.
+        """
+        import pymongo.errors
+
+        if db.name in self._prepared:
+            return
+        try:
+            db.create_collection(EVENTS_COLLECTION, capped=True, size=EVENTS_COLLECTION_BYTES)
+            # A tailable cursor on an empty capped collection dies immediately.
+            db[EVENTS_COLLECTION].insert_one({'at': datetime.now(timezone.utc)})
+        except pymongo.errors.CollectionInvalid:
+            if not db[EVENTS_COLLECTION].options().get('capped'):
+                logger.warning(
+                    "Converting uncapped '%s' in '%s' to a capped collection.",
+                    EVENTS_COLLECTION, db.name
+                )
+                db.command('convertToCapped', EVENTS_COLLECTION, size=EVENTS_COLLECTION_BYTES)
+        self._prepared.add(db.name)
+
+    def _tail(self, tenant):
+        try:
+            self._tail_events(tenant)
+        except Exception:
+            logger.exception("Change event tailer for tenant '%s' stopped.", tenant)
+            with self._tailed_lock:
+                self._tailed.discard(tenant)
+
+    def _tail_events(self, tenant):
+        import pymongo
+        import pymongo.errors
+
+        db = MongoDBConnection.get_db(tenant)
+        reconnect = False
+        while self._keep_tailing(tenant):
+            try:
+                self._ensure_collection(db)
+                # Start from the newest event; only later writes are news.
+                newest = db[EVENTS_COLLECTION].find_one(sort=[('$natural', -1)])
+                query = {'_id': {'$gt': newest['_id']}} if newest else {}
+                cursor = db[EVENTS_COLLECTION].find(query, cursor_type=pymongo.CursorType.TAILABLE_AWAIT)
+                if reconnect:
+                    # Events may have been missed while disconnected.
+                    InProcessChannel.publish(self, tenant)
+                # Each pass ends when a getMore comes back empty (about once a second).
+                while cursor.alive:
+                    for _ in cursor:
+                        InProcessChannel.publish(self, tenant)
+                    if not self._keep_tailing(tenant):
+                        cursor.close()
+                        return
+            except pymongo.errors.PyMongoError:
+                logger.warning(
+                    "Tailing change events for tenant '%s' failed; retrying.", tenant, exc_info=True
+                )
+            reconnect = True
+            time.sleep(1)
+
+
+_channel = None
+_channel_lock = threading.Lock()
+
+
+def get_channel():
+    global _channel
+    if _channel is None:
+        with _channel_lock:
+            if _channel is None:
+                _channel = MongoChannel() if settings.EVENT_CHANNEL == 'mongo' else InProcessChannel()
+    return _channel
+
+
+def publish_change():
+    """
+    Notify dashboard streams of the current tenant that data changed.
+    Best-effort: it runs after the write has been saved, so a failure is
+    logged instead of turning a successful write into an error response.
+    """
+    import pymongo.errors
+
+    tenant = get_current_tenant()
+    try:
+        get_channel().publish(tenant)
+    except pymongo.errors.PyMongoError:
+        logger.exception("Could not publish change notification for tenant '%s'.", tenant)
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from corsheaders.defaults import default_headers
 
 load_dotenv()
 
@@ -30,6 +31,7 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'hrms_project.tenancy.TenantMiddleware',
 ]
 
 ROOT_URLCONF = 'hrms_project.urls'
@@ -52,6 +54,41 @@ WSGI_APPLICATION = 'hrms_project.wsgi.application'
 # MongoDB Configuration
 MONGO_URI = os.environ.get('MONGO_URI', 'mongodb://localhost:27017/')
 MONGO_DB_NAME = os.environ.get('MONGO_DB_NAME', 'hrms_lite')
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+
+# Read routing: views with read_profile = 'reporting' read with this
+# preference; everything else stays on the primary. Modes: primary,
+# primaryPreferred, secondary, secondaryPreferred, nearest.
+# max_staleness_seconds is -1 (no limit) or at least 90.
+READ_PROFILES = {
+    'reporting': {
+        'mode': os.environ.get('REPORTING_READ_PREFERENCE', 'secondaryPreferred'),
+        'max_staleness_seconds': int(os.environ.get('REPORTING_MAX_STALENESS_SECONDS', '120')),
+    },
+}
+
+# Multi-tenancy: one database per company (<MONGO_DB_NAME>_<tenant>) on a
+# shared client. TENANT_RESOLVER is 'header' or 'host'. Only tenants
+# registered with `manage.py provision_tenant` are served; TENANTS is an
+# optional extra allowlist.
+MULTI_TENANT = os.environ.get('MULTI_TENANT', 'False') == 'True'
+TENANT_RESOLVER = os.environ.get('TENANT_RESOLVER', 'header')
+TENANT_HEADER = os.environ.get('TENANT_HEADER', 'X-Tenant-ID')
+TENANT_HOST_SUFFIX = os.environ.get('TENANT_HOST_SUFFIX', '')
+TENANTS = [t.strip().lower() for t in os.environ.get('TENANTS', '').split(',') if t.strip()]
+TENANT_DB_CACHE_SIZE = int(os.environ.get('TENANT_DB_CACHE_SIZE', '256'))
+
+# Live dashboard (Server-Sent Events). EVENT_CHANNEL is 'memory' (single
+# process) or 'mongo' (capped collection shared by all worker processes).
+EVENT_CHANNEL = os.environ.get('EVENT_CHANNEL', 'memory')
+SSE_HEARTBEAT_SECONDS = int(os.environ.get('SSE_HEARTBEAT_SECONDS', '15'))
+SSE_STREAM_MAX_SECONDS = int(os.environ.get('SSE_STREAM_MAX_SECONDS', '300'))
+SSE_RETRY_MS = 3000
+
+# Employee renames rewrite attendance.employee_name in batches of this size,
+# pausing between batches to leave room for other writes.
+NAME_PROPAGATION_BATCH_SIZE = int(os.environ.get('NAME_PROPAGATION_BATCH_SIZE', '500'))
+NAME_PROPAGATION_PAUSE_SECONDS = float(os.environ.get('NAME_PROPAGATION_PAUSE_SECONDS', '0.05'))
 
 DATABASES = {
     'default': {
@@ -77,6 +114,8 @@ CORS_ALLOWED_ORIGINS = os.environ.get(
 
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 
+CORS_ALLOW_HEADERS = (*default_headers, TENANT_HEADER.lower())
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
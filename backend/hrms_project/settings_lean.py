@@ -0,0 +1,41 @@
+"""
+Lean, API-only settings profile.
+
+The JSON API talks to MongoDB through pymongo and never touches sessions,
+Django auth, content types, templates or the ORM. This profile drops those
+apps and their middleware so workers start faster and every request skips
+the unused middleware.
+
+Enable it with:
+    DJANGO_SETTINGS_MODULE=hrms_project.settings_lean
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import REST_FRAMEWORK
+
+INSTALLED_APPS = [
+    'rest_framework',
+    'corsheaders',
+    'apps.employees',
+    'apps.attendance',
+]
+
+MIDDLEWARE = [
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'hrms_project.tenancy.TenantMiddleware',
+]
+
+TEMPLATES = []
+
+# No ORM usage: Django falls back to its dummy backend.
+DATABASES = {}
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    # Session/Basic authentication need django.contrib.auth; the API is open.
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
@@ -0,0 +1,69 @@
+"""
+Server-Sent Events helpers.
+
+event_stream() turns a payload builder into an SSE generator: it sends the
+payload once, then again only when the tenant's change version moves and the
+payload actually differs. Idle connections get a keep-alive comment every
+SSE_HEARTBEAT_SECONDS, and streams end after SSE_STREAM_MAX_SECONDS so the
+worker is released (EventSource reconnects on its own).
+"""
+
+import json
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer
+
+from .events import get_channel
+
+
+def format_event(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n'
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets DRF negotiate `Accept: text/event-stream`; errors become an 'error' event."""
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return format_event('error', data).encode(self.charset)
+
+
+def event_stream(tenant, build, event='message'):
+    """
+    Yield SSE messages for `build(version)`, re-sent after each change.
+    `build` should be cheap to call repeatedly for the same version.
+    """
+    channel = get_channel()
+    deadline = time.monotonic() + settings.SSE_STREAM_MAX_SECONDS
+
+    channel.subscribe(tenant)
+    try:
+        yield f'retry: {settings.SSE_RETRY_MS}\n\n'
+        version = channel.version(tenant)
+        last = build(version)
+        yield format_event(event, last)
+
+        while time.monotonic() < deadline:
+            version = channel.wait(tenant, version, settings.SSE_HEARTBEAT_SECONDS)
+            payload = build(version)
+            if payload == last:
+                yield ': keep-alive\n\n'
+                continue
+            last = payload
+            yield format_event(event, payload)
+    finally:
+        # Runs when the response is closed, including client disconnects.
+        channel.unsubscribe(tenant)
+
+
+def sse_response(stream):
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx and similar proxies from buffering the stream.
+    response['X-Accel-Buffering'] = 'no'
+    return response
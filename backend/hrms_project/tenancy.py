@@ -0,0 +1,77 @@
+"""
+Tenant resolution for multi-company deployments.
+
+When MULTI_TENANT is enabled, TenantMiddleware resolves the tenant for each
+request from a header or ?tenant= (TENANT_RESOLVER='header') or from the
+subdomain in front of TENANT_HOST_SUFFIX (TENANT_RESOLVER='host'). The
+tenant is exposed as request.tenant and through get_current_tenant(), which
+get_db() uses to pick the tenant's database. Only tenants registered with
+manage.py provision_tenant (and in TENANTS, when that allowlist is set) are
+served.
+"""
+
+import re
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import JsonResponse
+
+# Lowercase letters, digits, '_' and '-': safe inside a MongoDB database name.
+TENANT_REGEX = re.compile(r'^[a-z0-9][a-z0-9_-]{0,39}$')
+
+_current_tenant = ContextVar('hrms_tenant', default=None)
+
+
+def get_current_tenant():
+    """Tenant of the request being handled, or None in single-tenant mode."""
+    return _current_tenant.get()
+
+
+def resolve_tenant(request):
+    """Extract the tenant name from the request, or '' if none was given."""
+    if settings.TENANT_RESOLVER == 'host':
+        host = request.get_host().split(':')[0].lower()
+        suffix = '.' + settings.TENANT_HOST_SUFFIX.lstrip('.').lower()
+        tenant = host[:-len(suffix)] if host.endswith(suffix) else ''
+    else:
+        # EventSource cannot send custom headers, so ?tenant= is accepted too.
+        tenant = request.headers.get(settings.TENANT_HEADER) or request.GET.get('tenant', '')
+    return tenant.strip().lower()
+
+
+class TenantMiddleware:
+    """Bind each request to a tenant; rejects requests with an unknown tenant."""
+
+    def __init__(self, get_response):
+        if not settings.MULTI_TENANT:
+            raise MiddlewareNotUsed
+        from .db import MongoDBConnection
+
+        self.get_response = get_response
+        self.allowed = set(settings.TENANTS)
+        self.connection = MongoDBConnection
+
+    def __call__(self, request):
+        tenant = resolve_tenant(request)
+        if not tenant:
+            return JsonResponse(
+                {'success': False, 'error': 'Tenant is required.'},
+                status=400
+            )
+        if (
+            not TENANT_REGEX.match(tenant)
+            or (self.allowed and tenant not in self.allowed)
+            or self.connection.get_tenant_db(tenant) is None
+        ):
+            return JsonResponse(
+                {'success': False, 'error': f"Unknown tenant '{tenant}'."},
+                status=404
+            )
+
+        request.tenant = tenant
+        token = _current_tenant.set(tenant)
+        try:
+            return self.get_response(request)
+        finally:
+            _current_tenant.reset(token)
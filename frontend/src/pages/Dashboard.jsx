@@ -9,20 +9,32 @@ export default function Dashboard() {
   const [error, setError] = useState(null);
   const navigate = useNavigate();
 
-  const fetchDashboard = async () => {
+  // The stream sends the full summary on connect (read from the primary), so
+  // it is the only source: a separate fetch of /api/dashboard/ reads from a
+  // possibly lagging secondary and could overwrite fresher pushed data.
+  // Refresh / Retry simply reconnect.
+  const [streamKey, setStreamKey] = useState(0);
+  const reconnect = () => setStreamKey((k) => k + 1);
+
+  useEffect(() => {
     setLoading(true);
     setError(null);
-    try {
-      const res = await dashboardAPI.getSummary();
-      setData(res.data);
-    } catch (err) {
-      setError(err.message);
-    } finally {
-      setLoading(false);
-    }
-  };
-
-  useEffect(() => { fetchDashboard(); }, []);
+    const source = dashboardAPI.stream(
+      (summary) => {
+        setData(summary);
+        setError(null);
+        setLoading(false);
+      },
+      () => {
+        // EventSource retries on its own unless the connection was refused
+        if (source.readyState === EventSource.CLOSED) {
+          setError('Could not connect to live dashboard updates.');
+          setLoading(false);
+        }
+      }
+    );
+    return () => source.close();
+  }, [streamKey]);
 
   return (
     <div className="page-body">
@@ -31,11 +43,11 @@ export default function Dashboard() {
           <h1 className="page-title">Dashboard</h1>
           <p className="page-subtitle">Your HR operations at a glance.</p>
         </div>
-        <button className="btn btn-ghost" onClick={fetchDashboard}>↻ Refresh</button>
+        <button className="btn btn-ghost" onClick={reconnect}>↻ Refresh</button>
       </div>
 
       {loading && <LoadingState message="Loading dashboard..." />}
-      {error && <ErrorState message={error} onRetry={fetchDashboard} />}
+      {error && <ErrorState message={error} onRetry={reconnect} />}
 
       {data && !loading && (
         <>
@@ -6,10 +6,15 @@
 import axios from 'axios';
 
 const BASE_URL = process.env.REACT_APP_API_URL || '/api';
+// Only needed when the backend runs with MULTI_TENANT=True and header routing
+const TENANT_ID = process.env.REACT_APP_TENANT_ID;
 
 const api = axios.create({
   baseURL: BASE_URL,
-  headers: { 'Content-Type': 'application/json' },
+  headers: {
+    'Content-Type': 'application/json',
+    ...(TENANT_ID ? { 'X-Tenant-ID': TENANT_ID } : {}),
+  },
   timeout: 10000,
 });
 
@@ -36,6 +41,7 @@ export const employeeAPI = {
   getAll: (params = {}) => api.get('/employees/', { params }),
   getById: (employeeId) => api.get(`/employees/${employeeId}/`),
   create: (data) => api.post('/employees/', data),
+  update: (employeeId, data) => api.patch(`/employees/${employeeId}/`, data),
   delete: (employeeId) => api.delete(`/employees/${employeeId}/`),
 };
 
@@ -49,6 +55,15 @@ export const departmentAPI = {
 
 export const dashboardAPI = {
   getSummary: () => api.get('/dashboard/'),
+  // Server-Sent Events: onUpdate receives each new summary. Caller must close().
+  stream: (onUpdate, onError) => {
+    const url = new URL(`${BASE_URL}/dashboard/stream`, window.location.origin);
+    if (TENANT_ID) url.searchParams.set('tenant', TENANT_ID);
+    const source = new EventSource(url);
+    source.addEventListener('dashboard', (e) => onUpdate(JSON.parse(e.data)));
+    if (onError) source.onerror = onError;
+    return source;
+  },
 };
 
 // ─── Attendance ───────────────────────────────────────────────────────────────